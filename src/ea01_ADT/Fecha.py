@@ -1,31 +1,200 @@
+from functools import lru_cache, total_ordering
+from itertools import accumulate
+from operator import attrgetter
+import numpy as np
 
+# Dias de cada mes, indexados por [biciesto][mes] (el indice 0 no se usa)
+_DIAS_MES = (
+    (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+    (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+)
 
+# Dias acumulados antes del inicio de cada mes, indexados por [biciesto][mes-1]
+_CUM_DIAS = tuple(tuple(accumulate(dias[:12])) for dias in _DIAS_MES)
+
+# Versiones NumPy de las tablas para los calculos por lotes
+_CUM_DIAS_NP = np.array(_CUM_DIAS)
+_DIAS_MES_NP = np.array(_DIAS_MES)
+
+
+def _esBiciesto(año: int) -> bool:
+    """Determina si un año es biciesto.
+
+    `año & 3` equivale a `año % 4` y, cuando el año es multiplo de 100,
+    `año & 15` equivale a `año % 400` (400 = 16*25).
+    """
+    return (año & 3) == 0 and (año % 100 != 0 or (año & 15) == 0)
+
+
+def _biciestoLote(años: np.ndarray) -> np.ndarray:
+    """Mascara booleana de los años biciestos de un arreglo"""
+    return ((años % 4 == 0) & (años % 100 != 0)) | (años % 400 == 0)
+
+
+def _validarFecha(año: int, mes: int, dia: int, biciesto: bool) -> None:
+    """Lanza ValueError si año, mes y dia no forman una fecha valida.
+
+    Las verificaciones van de la mas barata a la mas costosa. Todos los
+    meses tienen al menos 28 dias, asi que solo se consulta la tabla de
+    dias del mes cuando el dia es mayor que 28 o invalido.
+    """
+    if año < 1:
+        raise ValueError(f"Año invalido: {año}")
+    if not 1 <= mes <= 12:
+        raise ValueError(f"Mes invalido: {mes}")
+    if not 1 <= dia <= 28:
+        diasMes = _DIAS_MES[biciesto][mes]
+        if not 1 <= dia <= diasMes:
+            raise ValueError(f"Dia invalido: {dia} (el mes {mes} de {año} tiene {diasMes} dias)")
+
+
+def _enteros(valores) -> np.ndarray:
+    """Convierte un escalar o una secuencia en un arreglo de enteros int64.
+
+    Acepta flotantes con valor entero (p.ej. 2024.0, comunes al leer un CSV);
+    cualquier otro valor no entero lanza TypeError.
+    """
+    arreglo = np.atleast_1d(np.asarray(valores))
+    if arreglo.size == 0 or arreglo.dtype.kind in 'iu':
+        return arreglo.astype(np.int64)
+    if arreglo.dtype.kind == 'f' and np.all(np.isfinite(arreglo)) and np.all(arreglo == np.floor(arreglo)):
+        return arreglo.astype(np.int64)
+    raise TypeError(f"Se esperaban valores enteros, no {arreglo.dtype}")
+
+
+def _arreglosLote(años, meses, dias) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Convierte los datos de un lote en arreglos de enteros de la misma forma"""
+    años, meses, dias = _enteros(años), _enteros(meses), _enteros(dias)
+    if not años.shape == meses.shape == dias.shape:
+        raise ValueError("Los arreglos de años, meses y dias deben tener la misma forma")
+    return años, meses, dias
+
+
+def _validarLote(años: np.ndarray, meses: np.ndarray, dias: np.ndarray) -> np.ndarray:
+    """Valida arreglos de fechas de una sola vez y retorna la mascara de años biciestos"""
+    if np.any(años < 1):
+        raise ValueError("Año invalido en los datos")
+    if np.any((meses < 1) | (meses > 12)):
+        raise ValueError("Mes invalido en los datos")
+    biciesto = _biciestoLote(años)
+    diasMes = _DIAS_MES_NP[biciesto.astype(np.intp), meses]
+    if np.any((dias < 1) | (dias > diasMes)):
+        raise ValueError("Dia invalido en los datos")
+    return biciesto
+
+
+# Fecha es inmutable: sus atributos solo se asignan al crearla, con object.__setattr__
+_asignar = object.__setattr__
+
+
+@total_ordering
 class Fecha:
 
+    # Sin __dict__ por instancia: menos memoria y acceso mas rapido a los atributos
+    __slots__ = ('_año', '_mes', '_dia', '_biciesto', '_diaDelAño', '_clave')
+
     def __init__(self, año:int, mes:int, dia:int):
-        self._año = año
-        self._mes = mes
-        self._dia = dia
+        biciesto = _esBiciesto(año)
+        _validarFecha(año, mes, dia, biciesto)
+        _asignar(self, '_año', año)
+        _asignar(self, '_mes', mes)
+        _asignar(self, '_dia', dia)
+        # Valores derivados: se calculan una sola vez por instancia
+        _asignar(self, '_biciesto', biciesto)
+        _asignar(self, '_diaDelAño', _CUM_DIAS[biciesto][mes-1] + dia)
+        # Entero AAAAMMDD: comparar fechas es comparar un solo entero
+        _asignar(self, '_clave', año*10000 + mes*100 + dia)
 
-    def diaDelAño(self) -> int:
-        # TODO Implementar el calculo del dia del año
-        pass
+    def __setattr__(self, nombre, valor):
+        raise AttributeError(f"Fecha es inmutable, no se puede asignar '{nombre}'")
+
+    def __delattr__(self, nombre):
+        raise AttributeError(f"Fecha es inmutable, no se puede borrar '{nombre}'")
+
+    def __reduce__(self):
+        """copy y pickle reconstruyen la fecha con el constructor, no con setattr"""
+        return (type(self), (self._año, self._mes, self._dia))
 
     @staticmethod
-    def esBiciesto(año: int) -> bool:
-        # TODO Implementar la funcion para determinar si un año es biciesto
-        pass
+    @lru_cache(maxsize=8192)
+    def obtener(año:int, mes:int, dia:int) -> 'Fecha':
+        """Retorna una instancia compartida de la fecha indicada.
+
+        Para ciclos que crean muchas veces las mismas fechas: la validacion y
+        la creacion del objeto se hacen una sola vez por fecha distinta.
+        Compartir la instancia es seguro porque Fecha es inmutable.
+        """
+        return Fecha(año, mes, dia)
+
+    @property
+    def clave(self) -> int:
+        """Entero AAAAMMDD con el mismo orden que las fechas.
+
+        Util para pasar a NumPy, p.ej. np.fromiter((f.clave for f in fechas), dtype=np.int32)
+        """
+        return self._clave
+
+    def diaDelAño(self) -> int:
+        """Retorna el dia del año (1..366), calculado en el constructor"""
+        return self._diaDelAño
+
+    esBiciesto = staticmethod(_esBiciesto)
+
+    @classmethod
+    def diaDelAñoLote(cls, años, meses, dias) -> np.ndarray:
+        """Calcula el dia del año de arreglos de fechas sin iterar en Python.
+
+        Lanza ValueError si alguna de las fechas no es valida.
+        """
+        años, meses, dias = _arreglosLote(años, meses, dias)
+        biciesto = _validarLote(años, meses, dias)
+        return _CUM_DIAS_NP[biciesto.astype(np.intp), meses-1] + dias
+
+    @classmethod
+    def desdeArreglos(cls, años, meses, dias) -> list['Fecha']:
+        """Construye instancias de Fecha a partir de arreglos paralelos.
+
+        La validacion se hace una sola vez sobre todos los arreglos, que deben
+        ser unidimensionales.
+        """
+        años, meses, dias = _arreglosLote(años, meses, dias)
+        if años.ndim != 1:
+            raise ValueError("desdeArreglos requiere arreglos unidimensionales")
+        biciesto = _validarLote(años, meses, dias)
+        diaDelAño = _CUM_DIAS_NP[biciesto.astype(np.intp), meses-1] + dias
+        claves = años*10000 + meses*100 + dias
+        nueva = cls._desdeValidados
+        return [ nueva(*fila) for fila in zip(años.tolist(), meses.tolist(), dias.tolist(),
+                                              biciesto.tolist(), diaDelAño.tolist(), claves.tolist()) ]
+
+    @classmethod
+    def _desdeValidados(cls, año: int, mes: int, dia: int, biciesto: bool, diaDelAño: int,
+                        clave: int) -> 'Fecha':
+        """Crea una Fecha con datos ya validados, sin pasar por __init__"""
+        fecha = object.__new__(cls)
+        _asignar(fecha, '_año', año)
+        _asignar(fecha, '_mes', mes)
+        _asignar(fecha, '_dia', dia)
+        _asignar(fecha, '_biciesto', biciesto)
+        _asignar(fecha, '_diaDelAño', diaDelAño)
+        _asignar(fecha, '_clave', clave)
+        return fecha
 
     def __str__(self) -> str:
         return f"{self._año:4d}-{self._mes:02d}-{self._dia:02d}"
 
     def __lt__(self, fecha) -> bool:
-        # TODO Implementar la comparacion 'menor que' entre fechas
-        pass
+        if not isinstance(fecha, Fecha):
+            return NotImplemented
+        return self._clave < fecha._clave
 
     def __eq__(self, fecha) -> bool:
-        # TODO Implementar la igualdad entre instancias de Fecha
-        pass
+        if not isinstance(fecha, Fecha):
+            return NotImplemented
+        return self._clave == fecha._clave
+
+    def __hash__(self) -> int:
+        return hash(self._clave)
 
     @staticmethod
     def leerFecha() -> 'Fecha':
@@ -34,12 +203,59 @@ class Fecha:
         pass
 
 
+# Funcion clave para ordenar colecciones de fechas: sorted(fechas, key=CLAVE_ORDEN)
+CLAVE_ORDEN = attrgetter('_clave')
+
+
 if __name__ == "__main__":
+    import copy
+    import pickle
 
     cumple = Fecha.leerFecha()      # Invocar un método estático
 
     fecha = Fecha(2022,5,9)         # Invocar el constructor
     print(fecha)
 
-    # TODO hacer pruebas unitarias de Fecha
+    assert not Fecha.esBiciesto(1900), "1900 no es biciesto"
+    assert Fecha.esBiciesto(2000), "2000 es biciesto"
+    assert Fecha.esBiciesto(2024), "2024 es biciesto"
+
+    assert Fecha(2023,12,31).diaDelAño()==365, "2023-12-31 debe ser el dia 365"
+    assert Fecha(2024,12,31).diaDelAño()==366, "2024-12-31 debe ser el dia 366"
+    assert Fecha(2024,3,1).diaDelAño()==61, "2024-03-01 debe ser el dia 61"
+
+    for invalida in [(2023,2,29), (2023,0,1), (2023,1,0), (0,1,1), (2023,4,31)]:
+        try:
+            Fecha(*invalida)
+            assert False, f"{invalida} no es una fecha valida"
+        except ValueError:
+            pass
+
+    f1, f2, f3 = Fecha(2023,12,31), Fecha(2024,1,1), Fecha(2024,1,1)
+    assert f1<f2 and f2>f1 and f2<=f3, "El orden de las fechas es incorrecto"
+    assert f2==f3 and f1!=f2, "La igualdad de las fechas es incorrecta"
+    assert hash(f2)==hash(f3), "Fechas iguales deben tener el mismo hash"
+    assert sorted([f2,f1,f3], key=CLAVE_ORDEN)==[f1,f2,f3], "CLAVE_ORDEN debe ordenar cronologicamente"
+    assert Fecha.obtener(2024,1,1) is Fecha.obtener(2024,1,1), "obtener debe compartir instancias"
+    assert copy.copy(f2)==f2 and copy.deepcopy(f2)==f2, "Las copias deben ser iguales al original"
+    assert pickle.loads(pickle.dumps(f1))==f1, "pickle debe reconstruir la fecha"
+
+    años, meses, dias = [1900,2000,2023,2024], [2,2,12,12], [28,29,31,31]
+    fechas = Fecha.desdeArreglos(años, meses, dias)
+    escalares = [ Fecha(a,m,d) for a,m,d in zip(años, meses, dias) ]
+    assert fechas==escalares, "desdeArreglos debe coincidir con el constructor"
+    assert [f.diaDelAño() for f in fechas]==[f.diaDelAño() for f in escalares], "diaDelAño debe coincidir"
+    assert Fecha.diaDelAñoLote(años, meses, dias).tolist()==[f.diaDelAño() for f in escalares], \
+        "diaDelAñoLote debe coincidir con diaDelAño"
+    assert Fecha.desdeArreglos([], [], [])==[], "Un lote vacio no produce fechas"
+    try:
+        Fecha.diaDelAñoLote([2024], [0], [1])
+        assert False, "El mes 0 no es valido"
+    except ValueError:
+        pass
+    try:
+        Fecha.desdeArreglos([[2024,2023]], [[1,2]], [[1,3]])
+        assert False, "desdeArreglos no debe aceptar arreglos de 2 dimensiones"
+    except ValueError:
+        pass
     
\ No newline at end of file
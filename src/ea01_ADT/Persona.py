@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import copy
+from dataclasses import dataclass, asdict
 from Fecha import Fecha
 
 
@@ -19,4 +20,7 @@ if __name__ == "__main__":
     print(p3)    
     assert p1>p2, "p1 es mayor a p2"
     assert p2<p3, "p2 es menor a p3"
-    assert not(p3<p1), "p3 no es menor a p1"
\ No newline at end of file
+    assert not(p3<p1), "p3 no es menor a p1"
+
+    assert asdict(p1)["fechaNacimiento"]==p1.fechaNacimiento, "asdict debe copiar la fecha"
+    assert copy.deepcopy(p1)==p1, "La copia de p1 debe ser igual a p1"
@@ -18,7 +18,7 @@ class Point2D(ABC):
     def distance(self, other:'Point2D') -> float:
         """Computes the distance to other Point2D
         """
-        return math.sqrt( (self.getX()-other.getX())**2 + (self.getY()-other.getY())**2 )
+        return math.hypot( self.getX()-other.getX(), self.getY()-other.getY() )
     
     @abstractmethod
     def __abs__(self) -> float:
@@ -52,11 +52,15 @@ class Point2D(ABC):
         """
         pass
     
-    def __eq__(self, other:'Point2D') -> bool:
+    def __eq__(self, other:object) -> bool:
         """Returns True if the value of self is equal (or very close) to the value of other
+
+        Compares the squared distance, so no square root is needed
         """
-        if other is not None:
-            if isinstance(other, Point2D):
-                if self.distance(other)<1E-15:
-                    return True
-        return False
\ No newline at end of file
+        if self is other:
+            return True
+        if not isinstance(other, Point2D):
+            return NotImplemented
+        dx = self.getX()-other.getX()
+        dy = self.getY()-other.getY()
+        return dx*dx + dy*dy < 1E-30
\ No newline at end of file
@@ -29,7 +29,16 @@ class Point2DCartesian(Point2D):
     def __abs__(self):
         """Returns the distance to the origin (magnitude)
         """
-        return math.sqrt( self._x**2 + self._y**2 )
+        return math.hypot( self._x, self._y )
+
+    def distance(self, other:Point2D) -> float:
+        """Computes the distance to other Point2D
+
+        Reads the coordinates directly when other is also cartesian
+        """
+        if isinstance(other, Point2DCartesian):
+            return math.hypot( self._x-other._x, self._y-other._y )
+        return math.hypot( self._x-other.getX(), self._y-other.getY() )
     
     def angle(self) -> float:
         """Returns the angle to the x axis
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#-----------------------------------------------------------------------
+# pointArray2D.py
+# A collection of 2D points stored as parallel coordinate arrays
+#-----------------------------------------------------------------------
+
+import numpy as np
+
+def distanceArray(x1:np.ndarray, y1:np.ndarray, x2:np.ndarray, y2:np.ndarray) -> np.ndarray:
+    """Computes the distances between two collections of points
+
+    The points are given as parallel arrays of coordinates (structure of arrays)
+    instead of a list of Point2D, so the work is done by NumPy without Python loops.
+    The arrays are used as given: their dtype is not changed
+    """
+    return np.hypot(x1-x2, y1-y2)
+
+class PointArray2D:
+    """Class representing a collection of points in the plane
+
+    Instead of one Point2D object per point (array of structures), the
+    coordinates are kept in two contiguous arrays xs, ys (structure of arrays),
+    so every operation is a single vectorized NumPy call.
+    The coordinates are float32 by default, which halves the memory traffic
+    compared to float64; pass dtype=np.float64 when more precision is needed.
+    Use it instead of a list of Point2D for batch work; a list of points can be
+    migrated with PointArray2D([p.getX() for p in pts], [p.getY() for p in pts])
+    """
+
+    __slots__ = ('xs', 'ys')
+
+    def __init__(self, xs, ys, dtype=np.float32):
+        """Constructs the collection from the x and y coordinates
+        """
+        self.xs = np.ascontiguousarray(xs, dtype=dtype)
+        self.ys = np.ascontiguousarray(ys, dtype=dtype)
+        if self.xs.shape != self.ys.shape:
+            raise ValueError("xs and ys must have the same shape")
+
+    @classmethod
+    def fromSoA(cls, xs, ys) -> 'PointArray2D':
+        """Constructs the collection from existing coordinate arrays, keeping their dtype
+
+        Contiguous arrays are used without copying
+        """
+        return cls(xs, ys, dtype=None)
+
+    def __len__(self) -> int:
+        """Returns the number of points
+        """
+        return len(self.xs)
+
+    @property
+    def dtype(self) -> np.dtype:
+        """Returns the type of the coordinates
+        """
+        return self.xs.dtype
+
+    def astype(self, dtype) -> 'PointArray2D':
+        """Returns a copy of the collection with its coordinates converted to the given type
+
+        Like ndarray.astype, the copy never shares its arrays with self
+        """
+        return PointArray2D(np.array(self.xs, dtype=dtype), np.array(self.ys, dtype=dtype), dtype=dtype)
+
+    def toFloat16(self) -> 'PointArray2D':
+        """Returns a float16 copy, meant only for storage
+
+        float16 only holds values up to 65504 in magnitude; larger coordinates
+        raise ValueError instead of silently becoming inf.
+        Convert it back with astype(np.float32) before computing with it
+        """
+        limit = np.finfo(np.float16).max
+        if np.any(np.abs(self.xs) > limit) or np.any(np.abs(self.ys) > limit):
+            raise ValueError(f"coordinates must be within +/-{limit} to be stored as float16")
+        return self.astype(np.float16)
+
+    def __abs__(self) -> np.ndarray:
+        """Returns the distance of each point to the origin (magnitude)
+        """
+        return np.hypot(self.xs, self.ys)
+
+    def angle(self) -> np.ndarray:
+        """Returns the angle of each point to the x axis
+        """
+        return np.arctan2(self.ys, self.xs)
+
+    def getX(self) -> np.ndarray:
+        """Returns the x components
+        """
+        return self.xs
+
+    def getY(self) -> np.ndarray:
+        """Returns the y components
+        """
+        return self.ys
+
+    def distance(self, other:'PointArray2D') -> np.ndarray:
+        """Computes the distance between each point and the corresponding point of other
+        """
+        if self.xs.shape != other.xs.shape:
+            raise ValueError("both collections must have the same number of points")
+        return np.hypot(self.xs-other.xs, self.ys-other.ys)
@@ -1,6 +1,8 @@
 import math
+import numpy as np
 from point2DCartesian import Point2DCartesian
 from point2DPolar import Point2DPolar
+from pointArray2D import PointArray2D, distanceArray
 
 
 if __name__=="__main__":
@@ -19,6 +21,33 @@ if __name__=="__main__":
     assert p2.getX()==math.sqrt(2)/2, "la componente x de p2 debe ser raiz(2)/2"
 
     assert abs(p2)==1, "La magnitud de p2 debe ser la unidad"
-    assert abs(p3)==1, "La magnitud de p3 debe ser la unidad"    
+    assert abs(p3)==1, "La magnitud de p3 debe ser la unidad"
 
-    
\ No newline at end of file
+    pa = PointArray2D([p1.getX(), p2.getX()], [p1.getY(), p2.getY()], dtype=np.float64)
+    assert len(pa)==2, "pa debe tener dos puntos"
+    assert abs(abs(pa)[1]-1)<1E-12, "La magnitud del segundo punto de pa debe ser la unidad"
+    assert abs(pa.distance(PointArray2D([0,0],[0,0],dtype=np.float64))[1]-p2.distance(p1))<1E-12, "Las distancias deben coincidir"
+    try:
+        PointArray2D([1,2,3],[1,2,3]).distance(PointArray2D([0],[0]))
+        assert False, "distance requiere colecciones del mismo tamaño"
+    except ValueError:
+        pass
+
+    pa32 = pa.astype(np.float32)
+    assert pa32.dtype==np.float32, "pa32 debe usar float32"
+    assert abs(abs(pa32)[1]-1)<1E-6, "La magnitud en float32 debe ser la unidad"
+    assert pa.toFloat16().dtype==np.float16, "toFloat16 debe usar float16"
+    copia = pa32.astype(np.float32)
+    copia.xs[0] = 7
+    assert pa32.xs[0]==0, "astype debe retornar una copia independiente"
+    try:
+        PointArray2D([1E5],[0]).toFloat16()
+        assert False, "toFloat16 no debe aceptar valores fuera del rango de float16"
+    except ValueError:
+        pass
+
+    xs, ys = np.array([0.0, 3.0]), np.array([0.0, 4.0])
+    assert distanceArray(xs, ys, np.zeros(2), np.zeros(2)).tolist()==[0.0, 5.0], "distanceArray debe calcular 0 y 5"
+    assert distanceArray(xs.astype(np.float32), ys.astype(np.float32), 0, 0).dtype==np.float32, "distanceArray debe conservar el dtype"
+    soa = PointArray2D.fromSoA(xs, ys)
+    assert soa.dtype==np.float64 and soa.xs is xs, "fromSoA debe usar los arreglos sin convertirlos"